@@ -31,7 +31,8 @@ Usage:
     This example checks if the object `obj` has an `age` of at least 18 and a `status` of "active".
 
 Dependencies:
-    Requires Python standard library modules `datetime` and `json`
+    Standard library only: `ast`, `datetime`, `functools`, `itertools`, `json`, `operator`, `sys`,
+    `threading`, `typing` and `weakref`
 
 Author:
     Sora_7672 - https://github.com/sora7672
@@ -40,10 +41,40 @@ License:
     MIT License
 """
 
+import ast
 from datetime import datetime, date, time, timedelta
+from functools import lru_cache
+from itertools import compress, repeat
 import json
+import operator
+from operator import attrgetter
+import sys
+from typing import Callable, Iterable
 
 from threading import Lock
+from weakref import WeakSet, WeakValueDictionary
+
+def _bind_name(namespace: dict, value) -> ast.Name:
+    """
+    Binds a value under a new name in the namespace of a compiled condition tree.
+
+    :param namespace: Globals the compiled expression is evaluated with.
+    :param value: The object to be referenced by the expression.
+    :return: Name node loading the value.
+    """
+    name = f"_{len(namespace)}"
+    namespace[name] = value
+    return ast.Name(id=name, ctx=ast.Load())
+
+
+def _constant(namespace: dict, value) -> ast.expr:
+    """
+    Returns a constant node for literal values, other values are bound in the namespace.
+    """
+    if type(value) in (str, int, float):
+        return ast.Constant(value=value)
+    return _bind_name(namespace, value)
+
 
 class ObjectCondition:
     """
@@ -55,15 +86,44 @@ class ObjectCondition:
          _accepted_comp_operators_numbers: Operators valid for numeric comparisons.
          _accepted_comp_operators_lists: Operators valid for list-based comparisons.
          _accepted_value_types: Supported data types for the condition's attribute value.
+         CHECK_TYPES: Wraps the evaluation in attribute and type checks for debugging, off by default.
+                      Read when a condition is created.
+
+     Creating a condition equal to one still alive returns that instance, conditions are immutable.
      """
-    _accepted_comp_operators_strings = ("==", "!=", "in", "not in")
-    _accepted_comp_operators_numbers = ("<", ">", "<=", ">=", "==", "!=")
-    _accepted_comp_operators_lists = ("in", "not in")
-    _accepted_comp_operators = tuple(set(_accepted_comp_operators_strings +
-                                         _accepted_comp_operators_numbers +
-                                         _accepted_comp_operators_lists))
+    __slots__ = ("_attribute_name", "_comp_operator", "_attribute_value", "_value_type",
+                 "_getter", "_predicate", "_batch", "_dict_cache", "_json_cache", "lock",
+                 "_checked", "_initialized", "__weakref__")
+
+    # Ordered for the public getters, the frozensets are used for membership tests
+    _ordered_comp_operators_strings = ("==", "!=", "in", "not in")
+    _ordered_comp_operators_numbers = ("<", ">", "<=", ">=", "==", "!=")
+    _accepted_comp_operators_strings = frozenset(_ordered_comp_operators_strings)
+    _accepted_comp_operators_numbers = frozenset(_ordered_comp_operators_numbers)
+    _accepted_comp_operators_lists = frozenset({"in", "not in"})
+    _accepted_comp_operators = (_accepted_comp_operators_strings |
+                                _accepted_comp_operators_numbers |
+                                _accepted_comp_operators_lists)
     # TODO: add weekdays, monthes to compare & also allowe == and != for these
-    _accepted_value_types = ("str", "int", "float", "date", "datetime", "time")
+    _accepted_value_types = frozenset({"str", "int", "float", "date", "datetime", "time"})
+
+    CHECK_TYPES: bool = False
+
+    # Alive conditions by their arguments, the value converted to its value type
+    _instances: WeakValueDictionary = WeakValueDictionary()
+
+    def __new__(cls, attribute_name: str, comp_operator: str,
+                attribute_value: str | int | float | date | datetime | time, value_type: str = "str"):
+        # Shared by the validated value, so e.g. 5 and "5" as int give the same condition
+        attribute_value = cls._validate(comp_operator, attribute_value, value_type)
+        key = cls._instance_key(attribute_name, comp_operator, attribute_value, value_type)
+        if key is not None:
+            instance = cls._instances.get(key)
+            if instance is not None:
+                return instance
+        instance = super().__new__(cls)
+        instance._attribute_value = attribute_value
+        return instance
 
     def __init__(self, attribute_name: str, comp_operator: str,
                  attribute_value: str | int | float | date | datetime | time, value_type: str = "str"):
@@ -75,53 +135,107 @@ class ObjectCondition:
         :param attribute_value: The value to compare against.
         :param value_type: The type of the attribute, default is 'str'.
         """
+        if getattr(self, "_initialized", False):
+            # Existing instance returned by __new__
+            return
 
-        if value_type not in self._accepted_value_types:
-            raise ValueError(f"Value type {value_type} is not accepted. Accepted types: {self._accepted_value_types}")
-        if comp_operator not in self._accepted_comp_operators:
-            raise ValueError("Comp operators not supported")
-
+        # The attribute value was validated and converted by __new__
         self._value_type = value_type
-        self._comp_operator: str = comp_operator
-        self._attribute_name: str = attribute_name
+        # Interned, so names and operators loaded from json share one string object
+        self._comp_operator: str = sys.intern(comp_operator)
+        self._attribute_name: str = sys.intern(attribute_name)
+
+        self._setup(self._instance_key(attribute_name, comp_operator, self._attribute_value, value_type))
+
+    @classmethod
+    def _validate(cls, comp_operator: str, attribute_value, value_type: str):
+        """
+        Checks the operator against the value type and converts the value to it.
+
+        :return: The attribute value as value_type.
+        """
+        if value_type not in cls._accepted_value_types:
+            raise ValueError(f"Value type {value_type} is not accepted. Accepted types: {sorted(cls._accepted_value_types)}")
+        if comp_operator not in cls._accepted_comp_operators:
+            raise ValueError("Comp operators not supported")
 
         match value_type:
             case "str":
-                if self._comp_operator not in self._accepted_comp_operators_strings:
-                    raise ValueError(f"Comp operator {self._comp_operator} not supported for strings")
-                self._attribute_value = str(attribute_value)
+                if comp_operator not in cls._accepted_comp_operators_strings:
+                    raise ValueError(f"Comp operator {comp_operator} not supported for strings")
+                return str(attribute_value)
 
             case "int":
-                if self._comp_operator not in self._accepted_comp_operators_numbers:
-                    raise ValueError(f"Comp operator {self._comp_operator} not supported for numbers")
-                self._attribute_value = int(attribute_value)
+                if comp_operator not in cls._accepted_comp_operators_numbers:
+                    raise ValueError(f"Comp operator {comp_operator} not supported for numbers")
+                return int(attribute_value)
 
             case "float":
-                if self._comp_operator not in self._accepted_comp_operators_numbers:
-                    raise ValueError(f"Comp operator {self._comp_operator} not supported for numbers")
-                self._attribute_value = float(attribute_value)
+                if comp_operator not in cls._accepted_comp_operators_numbers:
+                    raise ValueError(f"Comp operator {comp_operator} not supported for numbers")
+                return float(attribute_value)
 
             case "date":
-                if self._comp_operator not in self._accepted_comp_operators_numbers:
-                    raise ValueError(f"Comp operator {self._comp_operator} not supported for numbers")
-                self._attribute_value = self.parse_datetime(attribute_value).date()
+                if comp_operator not in cls._accepted_comp_operators_numbers:
+                    raise ValueError(f"Comp operator {comp_operator} not supported for numbers")
+                return cls._parse_date(attribute_value)
 
             case "time":
-                if self._comp_operator not in self._accepted_comp_operators_numbers:
-                    raise ValueError(f"Comp operator {self._comp_operator} not supported for numbers")
-                self._attribute_value = self.parse_datetime(attribute_value).time()
+                if comp_operator not in cls._accepted_comp_operators_numbers:
+                    raise ValueError(f"Comp operator {comp_operator} not supported for numbers")
+                return cls._parse_time(attribute_value)
 
             case "datetime":
-                if self._comp_operator not in self._accepted_comp_operators_numbers:
-                    raise ValueError(f"Comp operator {self._comp_operator} not supported for numbers")
-                self._attribute_value = self.parse_datetime(attribute_value)
+                if comp_operator not in cls._accepted_comp_operators_numbers:
+                    raise ValueError(f"Comp operator {comp_operator} not supported for numbers")
+                return cls.parse_datetime(attribute_value)
 
             case _:
                 raise ValueError(f"Invalid value type {value_type}")
 
+    def _setup(self, key: tuple | None):
+        """
+        Builds the evaluation functions and serialized form from the validated attributes.
 
+        :param key: Key of the condition in the instance cache, None to not share it.
+        """
+        self._getter: Callable[[object], object] = attrgetter(self._attribute_name)
+        # Decided once, the predicate, batch kernel and compiled expression all follow it
+        self._checked: bool = self.CHECK_TYPES
+        self._predicate: Callable[[object], bool] = self._build_predicate()
+        self._batch: Callable[[Iterable], list[bool]] = self._build_batch()
+        # Conditions are immutable, so they are serialized once, the json string on first use
+        self._dict_cache: dict = {
+            "attribute_name": self._attribute_name,
+            "comp_operator": self._comp_operator,
+            "attribute_value": self._serialize_value(),
+            "value_type": self._value_type
+        }
+        self._json_cache: str | None = None
         self.lock = Lock()
 
+        # Only fully initialized conditions are shared
+        self._initialized = True
+        if key is not None:
+            self._instances[key] = self
+
+    @classmethod
+    def _instance_key(cls, attribute_name, comp_operator, attribute_value, value_type) -> tuple | None:
+        """
+        Builds the key of a condition in the instance cache.
+
+        :param attribute_value: The value already converted to value_type.
+        :return: Hashable tuple of the arguments, None if the value can not be hashed.
+        """
+        # The type of the value keeps e.g. 1.0 and 1 apart, CHECK_TYPES changes the built predicate
+        key = (cls, attribute_name, comp_operator, value_type, type(attribute_value), attribute_value,
+               cls.CHECK_TYPES)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
     @property
     def attribute_name(self) -> str:
         with self.lock:
@@ -134,8 +248,7 @@ class ObjectCondition:
 
     @property
     def attribute_value(self) -> str:
-        with self.lock:
-            return str(self._attribute_value)
+        return self._dict_cache["attribute_value"]
 
     def is_true(self, obj: object) -> bool:
         """
@@ -145,64 +258,184 @@ class ObjectCondition:
         :return: Boolean indicating if the condition holds true for the given object.
         """
 
-        if not hasattr(obj, self._attribute_name):
-            raise AttributeError(f"Condition evaluation error.\nObject ({obj}) has no attribute {self._attribute_name}")
+        return self._predicate(obj)
+
+    def is_true_batch(self, objs) -> list[bool]:
+        """
+        Evaluates the condition against many objects at once.
+
+        :param objs: Iterable of objects containing the attribute to be checked.
+        :return: List of booleans in the order of the given objects.
+        """
+        return self._batch(objs)
 
-        test_value = getattr(obj, self._attribute_name)
+    def _comparison(self) -> tuple[Callable[[object, object], bool], object]:
+        """
+        Looks up the comparison function of the operator for the value type.
 
+        :return: The comparison function and the value it is called with.
+        """
         if self._value_type == "str":
-            if not isinstance(test_value, (str, tuple, list, set, frozenset)):
-                raise TypeError(f"Condition evaluation error.\nObject ({obj}) attribute type {type(test_value)} "
-                                f"is not type (str, tuple, list, set, frozenset)")
-        elif self._value_type in ("date", "time", "datetime"):
-            test_value = self.convert_to_type(test_value)
+            return self._OP_TABLE_STRINGS[self._comp_operator], self._attribute_value.lower()
+        return self._OP_TABLE[self._comp_operator], self._attribute_value
+
+    def _build_predicate(self) -> Callable[[object], bool]:
+        """
+        Builds the evaluation function for this condition once, so is_true only has to call it.
+
+        :return: Function taking the object and returning the result of the comparison.
+        """
+        getter = self._getter
+        compare, value = self._comparison()
 
-        elif not isinstance(test_value, type(self._attribute_value)):
-            raise TypeError(f"Condition evaluation error.\nObject ({obj}) attribute type {type(test_value)} "
-                            f"is not type {type(self._attribute_value)}")
+        if self._value_type in ("date", "time", "datetime"):
+            convert = self.convert_to_type
 
+            def predicate(obj: object) -> bool:
+                return compare(value, convert(getter(obj)))
+        else:
+            def predicate(obj: object) -> bool:
+                return compare(value, getter(obj))
 
+        if self._checked:
+            return self._with_type_checks(predicate)
+        return predicate
 
-        match self._comp_operator:
-            # FIXME: seems to not working properly anyhow?
-            case "in":
-                if isinstance(test_value, str):
-                    return self._attribute_value.lower() in test_value.lower()
-                else:
-                    return self._attribute_value.lower() in [item.lower() for item in test_value]
+    def _build_batch(self) -> Callable[[Iterable], list[bool]]:
+        """
+        Builds the evaluation function for many objects at once. Without type checks the values
+        are read, converted and compared by chained map calls, so the loop over the objects runs in C.
 
-            case "not in":
-                if isinstance(test_value, str):
-                    return self._attribute_value.lower() not in test_value.lower()
-                else:
-                    return self._attribute_value.lower() not in [item.lower() for item in test_value]
+        :return: Function taking the objects and returning the list of results.
+        """
+        if self._checked:
+            predicate = self._predicate
 
-            case "<":
-                return self._attribute_value < test_value
+            def batch(objs: Iterable) -> list[bool]:
+                return list(map(predicate, objs))
+            return batch
 
-            case ">":
-                return self._attribute_value > test_value
+        getter = self._getter
+        compare, value = self._comparison()
 
-            case "<=":
-                return self._attribute_value <= test_value
+        if self._value_type in ("date", "time", "datetime"):
+            convert = self.convert_to_type
 
-            case ">=":
-                return self._attribute_value >= test_value
+            def batch(objs: Iterable) -> list[bool]:
+                return list(map(compare, repeat(value), map(convert, map(getter, objs))))
+        else:
+            def batch(objs: Iterable) -> list[bool]:
+                return list(map(compare, repeat(value), map(getter, objs)))
+        return batch
 
-            case "==":
-                if isinstance(test_value, str):
-                    return test_value.lower() == self._attribute_value.lower()
-                else:
-                    return test_value == self._attribute_value
+    def _with_type_checks(self, predicate: Callable[[object], bool]) -> Callable[[object], bool]:
+        """
+        Wraps the evaluation function with the attribute and type checks of the object.
 
-            case "!=":
-                if isinstance(test_value, str):
-                    return test_value.lower() != self._attribute_value.lower()
-                else:
-                    return test_value != self._attribute_value
+        :param predicate: The evaluation function built for this condition.
+        :return: Function running the checks before calling the predicate.
+        """
+        getter = self._getter
+        if self._value_type == "str":
+            expected_type = (str, tuple, list, set, frozenset)
+            expected_name = "(str, tuple, list, set, frozenset)"
+        elif self._value_type in ("date", "time", "datetime"):
+            # convert_to_type already raises on unsupported types
+            expected_type = None
+            expected_name = ""
+        elif self._value_type == "float":
+            # Integers compare fine with float values
+            expected_type = (int, float)
+            expected_name = "(int, float)"
+        else:
+            expected_type = type(self._attribute_value)
+            expected_name = str(expected_type)
 
-            case _:
-                raise Exception(f"Unknown comparison operator {self._comp_operator}")
+        def checked(obj: object) -> bool:
+            # A missing attribute raises AttributeError from the getter
+            test_value = getter(obj)
+            if expected_type is not None and not isinstance(test_value, expected_type):
+                raise TypeError(f"Condition evaluation error.\nObject ({obj}) attribute type {type(test_value)} "
+                                f"is not type {expected_name}")
+            return predicate(obj)
+
+        return checked
+
+    @staticmethod
+    def _str_equals(value: str, test_value) -> bool:
+        if isinstance(test_value, str):
+            return test_value.lower() == value
+        return test_value == value
+
+    @staticmethod
+    def _str_not_equals(value: str, test_value) -> bool:
+        if isinstance(test_value, str):
+            return test_value.lower() != value
+        return test_value != value
+
+    @staticmethod
+    def _str_in(value: str, test_value) -> bool:
+        # Substring check for strings, case-insensitive item check for collections
+        if isinstance(test_value, str):
+            return value in test_value.lower()
+        return any(isinstance(item, str) and item.lower() == value for item in test_value)
+
+    @staticmethod
+    def _str_not_in(value: str, test_value) -> bool:
+        return not ObjectCondition._str_in(value, test_value)
+
+    # Comparison functions called as function(condition value, object value)
+    _OP_TABLE = {
+        "<": operator.lt,
+        ">": operator.gt,
+        "<=": operator.le,
+        ">=": operator.ge,
+        "==": operator.eq,
+        "!=": operator.ne,
+    }
+    _OP_TABLE_STRINGS = {
+        "==": _str_equals,
+        "!=": _str_not_equals,
+        "in": _str_in,
+        "not in": _str_not_in,
+    }
+    _AST_OPERATORS = {
+        "<": ast.Lt,
+        ">": ast.Gt,
+        "<=": ast.LtE,
+        ">=": ast.GtE,
+        "==": ast.Eq,
+        "!=": ast.NotEq,
+    }
+
+    def _expression(self, namespace: dict) -> ast.expr:
+        """
+        Builds the expression of this condition on the object 'o' for ConditionList.compile.
+        Conditions built with CHECK_TYPES enabled are called through their checked predicate.
+
+        :param namespace: Globals the compiled expression is evaluated with.
+        :return: Expression node evaluating the condition.
+        """
+        obj = ast.Name(id="o", ctx=ast.Load())
+        if self._checked:
+            return ast.Call(func=_bind_name(namespace, self._predicate), args=[obj], keywords=[])
+
+        # Same lookup as attrgetter, dotted names are followed attribute by attribute
+        test_value = obj
+        for part in self._attribute_name.split("."):
+            test_value = ast.Attribute(value=test_value, attr=part, ctx=ast.Load())
+
+        if self._value_type == "str":
+            compare = _bind_name(namespace, self._OP_TABLE_STRINGS[self._comp_operator])
+            value = ast.Constant(value=self._attribute_value.lower())
+            return ast.Call(func=compare, args=[value, test_value], keywords=[])
+
+        if self._value_type in ("date", "time", "datetime"):
+            convert = _bind_name(namespace, self.convert_to_type)
+            test_value = ast.Call(func=convert, args=[test_value], keywords=[])
+        return ast.Compare(left=_constant(namespace, self._attribute_value),
+                           ops=[self._AST_OPERATORS[self._comp_operator]()],
+                           comparators=[test_value])
 
     def to_dict(self) -> dict:
         """
@@ -210,14 +443,7 @@ class ObjectCondition:
 
         :return: A dictionary with the condition's parameters.
         """
-        with self.lock:
-            return {
-                "attribute_name": self._attribute_name,
-                "comp_operator": self._comp_operator,
-                "attribute_value": str(self._attribute_value),
-                "value_type": self._value_type
-            }
-
+        return dict(self._dict_cache)
 
     def json(self) -> str:
         """
@@ -225,7 +451,19 @@ class ObjectCondition:
 
         :return: JSON string representation of the condition.
         """
-        return json.dumps(self.to_dict())
+        if self._json_cache is None:
+            self._json_cache = json.dumps(self._dict_cache)
+        return self._json_cache
+
+    def _serialize_value(self) -> str:
+        """
+        Serializes the attribute value to a string, which parses back to the same value.
+
+        :return: ISO format for date, time and datetime values, str() for the others.
+        """
+        if self._value_type in ("date", "time", "datetime"):
+            return self._attribute_value.isoformat()
+        return str(self._attribute_value)
 
     def convert_to_type(self, input_value):
         # Ensure output_type is valid
@@ -264,11 +502,12 @@ class ObjectCondition:
             return dt_value
 
     @classmethod
-    def from_json(cls, data: str | dict) -> 'ObjectCondition':
+    def from_json(cls, data: str | dict, trusted: bool = False) -> 'ObjectCondition':
         """
         Creates an ObjectCondition instance from a JSON string or dictionary.
 
         :param data: A JSON string or dictionary with condition parameters.
+        :param trusted: Skips the validation for data written by to_dict or json.
         :return: ObjectCondition instance initialized with the given data.
         """
         if isinstance(data, str):
@@ -276,6 +515,8 @@ class ObjectCondition:
         elif not isinstance(data, dict):
             raise ValueError("Input must be a JSON string or a dictionary.")
 
+        if trusted:
+            return cls._from_trusted(data)
         return cls(
             attribute_name=data["attribute_name"],
             comp_operator=data["comp_operator"],
@@ -283,31 +524,91 @@ class ObjectCondition:
             value_type=data["value_type"]
         )
 
+    @classmethod
+    def _from_trusted(cls, data: dict) -> 'ObjectCondition':
+        """
+        Creates an ObjectCondition from serialized data without validating it again.
+
+        :param data: Dictionary written by to_dict.
+        :return: ObjectCondition instance initialized with the given data.
+        """
+        attribute_name = data["attribute_name"]
+        comp_operator = data["comp_operator"]
+        attribute_value = data["attribute_value"]
+        value_type = data["value_type"]
+        attribute_value = cls._COERCE[value_type](attribute_value)
+
+        key = cls._instance_key(attribute_name, comp_operator, attribute_value, value_type)
+        if key is not None:
+            instance = cls._instances.get(key)
+            if instance is not None:
+                return instance
+
+        instance = super().__new__(cls)
+        instance._value_type = value_type
+        instance._comp_operator = sys.intern(comp_operator)
+        instance._attribute_name = sys.intern(attribute_name)
+        instance._attribute_value = attribute_value
+        instance._setup(key)
+        return instance
+
     @classmethod
     def get_operators_for_string(cls):
-        return cls._accepted_comp_operators_strings
+        return cls._ordered_comp_operators_strings
 
     @classmethod
     def get_operators_for_number(cls):
-        return cls._accepted_comp_operators_numbers
+        return cls._ordered_comp_operators_numbers
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def parse_datetime(value: str) -> datetime:
         """
         Parses a date/time from string or timestamp.
+        Results are cached, conditions loaded in bulk often share the same values.
         :param value: string with timestamp or date.
         :return: datetime object representing the given value.
         """
-        if value.replace('.', '', 1).isdigit():
-            timestamp = float(value)
-            return datetime.fromtimestamp(timestamp)
-        elif "-" in value and ("T" in value or len(value) == 10):
-            if len(value) == 10:
-                return datetime.fromisoformat(value + "T00:00:00")
-            else:
+        try:
+            # ISO dates have their first dash within the year, timestamps never contain one there
+            if "-" in value[:5]:
                 return datetime.fromisoformat(value)
-        else:
-            raise ValueError("Input is not a recognized Unix timestamp or ISO datetime format.")
+            return datetime.fromtimestamp(float(value))
+        except (ValueError, OverflowError, OSError):
+            raise ValueError("Input is not a recognized Unix timestamp or ISO datetime format.") from None
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_date(value: str) -> date:
+        return ObjectCondition.parse_datetime(value).date()
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_time(value: str) -> time:
+        # ISO times as written by json, timestamps and datetimes never have a colon at index 2
+        if value[2:3] == ":":
+            try:
+                return time.fromisoformat(value)
+            except ValueError:
+                raise ValueError("Input is not a recognized ISO time format.") from None
+        return ObjectCondition.parse_datetime(value).time()
+
+    # Conversion of serialized attribute values by value type
+    _COERCE = {
+        "str": str,
+        "int": int,
+        "float": float,
+        "date": _parse_date,
+        "time": _parse_time,
+        "datetime": parse_datetime,
+    }
+
+    def __copy__(self) -> 'ObjectCondition':
+        # Conditions are immutable and shared, a copy is the same instance
+        return self
+
+    def __deepcopy__(self, memo: dict) -> 'ObjectCondition':
+        return self
 
     def __str__(self) -> str:
         return f"Condition on {self._attribute_name} {self._comp_operator} {self._attribute_value} ({self._value_type})"
@@ -320,59 +621,408 @@ class ConditionList:
 
     Attributes:
       _accepted_boolean_operators: Operators valid for combining conditions (and, or).
+      _reorder_interval: Evaluations between two reorders of an adaptive list.
+
+    The list is evaluated against an object with is_true(obj), which short-circuits
+    on the first condition deciding the result. Nested lists are flattened into one
+    program, so evaluating a deep tree does not recurse. is_true is rebound when the
+    tree changes, keep a reference to the list instead of its is_true.
+
+    conditions is a tuple and adaptive is read-only. The list is changed with add(), remove(),
+    clear() or by assigning conditions or operator, which rebuilds it and the lists containing it.
     """
-    _accepted_boolean_operators = ("and", "or")
+    __slots__ = ("_conditions", "_operator", "_adaptive", "lock", "is_true",
+                 "_ranked", "_calls", "_compiled", "_generation", "_parents", "__weakref__")
 
-    def __init__(self, *conditions, operator: str = "and"):
+    _accepted_boolean_operators = frozenset({"and", "or"})
+    _reorder_interval = 1024
+
+    def __init__(self, *conditions, operator: str = "and", adaptive: bool = False):
         """
         Initializes a ConditionList with specified conditions and logical operator.
 
         :param conditions: Conditions to be evaluated as a list of ObjectCondition or ConditionList instances.
         :param operator: Logical operator to apply across conditions, either 'and' or 'or'.
+        :param adaptive: Tracks how often each condition is true and periodically evaluates the
+                         deciding conditions first (false first for 'and', true first for 'or').
+                         The declared order in conditions is kept for serialization.
         """
-        self.conditions = []
+        conditions_added = []
         self.lock = Lock()
         if operator.lower() not in self._accepted_boolean_operators:
             raise ValueError("Operator not supported")
-        self.operator = operator.lower()
-
+        self._operator = sys.intern(operator.lower())
+        self._adaptive: bool = adaptive
+        self._compiled = False
+        # Counts the changes of the tree, a predicate built before a change is not bound
+        self._generation = 0
+        # Lists containing this one, their predicate and compiled code are rebuilt when this list changes
+        self._parents: WeakSet = WeakSet()
+
+        # The same condition twice does not change the result, it is only kept once
+        seen = set()
         for condition in conditions:
             if isinstance(condition, ObjectCondition) or isinstance(condition, ConditionList):
-                self.conditions.append(condition)
+                if id(condition) in seen:
+                    continue
+                seen.add(id(condition))
+                conditions_added.append(condition)
+                if isinstance(condition, ConditionList):
+                    condition._parents.add(self)
             else:
                 raise ValueError(f"Invalid condition type {type(condition)}")
+        self._conditions: tuple = tuple(conditions_added)
+
+        # is_true is bound once per list, there is no branch on the operator per call
+        if adaptive:
+            # [condition, true count, evaluation count] in evaluation order
+            self._ranked: list[list] = [[condition, 0, 0] for condition in self._conditions]
+            self._calls = 0
+            self.is_true: Callable[[object], bool] = (self._is_true_or_adaptive if self._operator == "or"
+                                                      else self._is_true_and_adaptive)
+        else:
+            self.is_true = self._evaluate_first
+
+    @property
+    def conditions(self) -> tuple:
+        return self._conditions
+
+    @conditions.setter
+    def conditions(self, conditions: Iterable):
+        with self.lock:
+            accepted = self._accepted(conditions, ())
+            self._replace(())
+            self._extend(accepted)
+        self._changed()
+
+    @property
+    def operator(self) -> str:
+        return self._operator
+
+    @operator.setter
+    def operator(self, operator: str):
+        if operator.lower() not in self._accepted_boolean_operators:
+            raise ValueError("Operator not supported")
+        with self.lock:
+            self._operator = sys.intern(operator.lower())
+            if self._adaptive:
+                self.is_true = self._is_true_or_adaptive if self._operator == "or" else self._is_true_and_adaptive
+        self._changed()
+
+    @property
+    def adaptive(self) -> bool:
+        return self._adaptive
 
     def add(self, *conditions, operator: str = "and"):
         with self.lock:
-            for condition in conditions:
-                if isinstance(condition, ObjectCondition) or isinstance(condition, ConditionList):
-                    self.conditions.append(condition)
-                else:
-                    raise ValueError(f"Invalid condition type {type(condition)}")
+            self._extend(self._accepted(conditions, self._conditions))
+        self._changed()
 
-    def is_true(self, obj: object) -> bool:
+    def remove(self, *conditions):
+        """
+        Removes conditions from the list.
+
+        :param conditions: ObjectCondition or ConditionList instances contained in this list.
+        """
+        with self.lock:
+            removed = {id(condition) for condition in conditions}
+            missing = removed - {id(condition) for condition in self._conditions}
+            if missing:
+                raise ValueError("Condition is not in the list")
+            self._replace(tuple(condition for condition in self._conditions if id(condition) not in removed))
+        self._changed()
+
+    def clear(self):
+        """
+        Removes all conditions from the list.
+        """
+        with self.lock:
+            self._replace(())
+        self._changed()
+
+    def _replace(self, conditions: tuple):
+        """
+        Sets the conditions of the list to a subset of the current ones, called with the lock held.
+        """
+        kept = {id(condition) for condition in conditions}
+        for condition in self._conditions:
+            if isinstance(condition, ConditionList) and id(condition) not in kept:
+                condition._parents.discard(self)
+        self._conditions = conditions
+        if self._adaptive:
+            # Replaced, running evaluations keep their snapshot, the kept counts stay
+            self._ranked = [stats for stats in self._ranked if id(stats[0]) in kept]
+
+    def _accepted(self, conditions: Iterable, current: tuple) -> tuple:
+        """
+        Validates conditions to be added next to current, conditions already in it are dropped.
+        """
+        seen = {id(condition) for condition in current}
+        accepted = []
+        for condition in conditions:
+            if isinstance(condition, ObjectCondition) or isinstance(condition, ConditionList):
+                if id(condition) in seen:
+                    continue
+                if isinstance(condition, ConditionList) and condition._contains(self):
+                    raise ValueError("A condition list can not contain itself")
+                seen.add(id(condition))
+                accepted.append(condition)
+            else:
+                raise ValueError(f"Invalid condition type {type(condition)}")
+        return tuple(accepted)
+
+    def _extend(self, conditions: tuple):
+        """
+        Appends validated conditions to the list, called with the lock held.
+        """
+        # Replaced instead of appended, so the tuple stays read-only
+        self._conditions = self._conditions + conditions
+        for condition in conditions:
+            if isinstance(condition, ConditionList):
+                condition._parents.add(self)
+        if self._adaptive:
+            # Replaced instead of appended, running evaluations keep their snapshot
+            self._ranked = self._ranked + [[condition, 0, 0] for condition in conditions]
+
+    def _contains(self, condition_list: "ConditionList") -> bool:
+        """
+        Checks if condition_list is this list or nested anywhere in it.
+        """
+        pending = [self]
+        seen = set()
+        while pending:
+            current = pending.pop()
+            if current is condition_list:
+                return True
+            if id(current) in seen:
+                continue
+            seen.add(id(current))
+            pending.extend(condition for condition in current._conditions if isinstance(condition, ConditionList))
+        return False
+
+    def _changed(self):
+        """
+        Resets the predicate and rebuilds the compiled code of this list and of all lists containing it.
+        """
+        pending = [self]
+        seen = set()
+        while pending:
+            condition_list = pending.pop()
+            if id(condition_list) in seen:
+                continue
+            seen.add(id(condition_list))
+            with condition_list.lock:
+                condition_list._generation += 1
+                if not condition_list._adaptive:
+                    condition_list.is_true = condition_list._evaluate_first
+            if condition_list._compiled:
+                condition_list.compile()
+            pending.extend(condition_list._parents)
+
+    def compile(self):
+        """
+        Compiles the whole condition tree into a single Python function, which replaces is_true.
+        Meant for stable trees evaluated against many objects, adding conditions to this list
+        or to a nested one compiles it again. Adaptive lists are called as they are.
+        """
+        if self._adaptive:
+            raise ValueError("Adaptive condition lists can not be compiled")
+
+        arguments = ast.arguments(posonlyargs=[], args=[ast.arg(arg="o")], kwonlyargs=[], kw_defaults=[], defaults=[])
+        while True:
+            generation = self._generation
+            namespace = {}
+            tree = ast.Expression(body=ast.Lambda(args=arguments, body=self._expression(namespace)))
+            ast.fix_missing_locations(tree)
+            compiled = eval(compile(tree, "<condition list>", "eval"), namespace)
+
+            with self.lock:
+                # Code built before a concurrent change is dropped and the tree compiled again
+                if generation == self._generation:
+                    self.is_true = compiled
+                    self._compiled = True
+                    return
+
+    def _expression(self, namespace: dict) -> ast.expr:
+        """
+        Builds the expression of this list on the object 'o' for compile.
+
+        :param namespace: Globals the compiled expression is evaluated with.
+        :return: Expression node evaluating the list.
+        """
+        if self._adaptive:
+            evaluate = self._is_true_or_adaptive if self._operator == "or" else self._is_true_and_adaptive
+            return ast.Call(func=_bind_name(namespace, evaluate), args=[ast.Name(id="o", ctx=ast.Load())],
+                            keywords=[])
+
+        values = [condition._expression(namespace) for condition in self._conditions]
+        if not values:
+            return ast.Constant(value=self._operator == "and")
+        if len(values) == 1:
+            return values[0]
+        return ast.BoolOp(op=ast.Or() if self._operator == "or" else ast.And(), values=values)
+
+    # Program targets ending the evaluation, instructions are indexed from 0
+    _FALSE = -1
+    _TRUE = -2
+
+    def _flatten(self) -> tuple[int, list[tuple]]:
+        """
+        Flattens the tree into a program of (evaluate, next if true, next if false) instructions.
+        A target is the index of the next instruction or one of _TRUE and _FALSE ending the evaluation.
+        Nested lists are emitted inline, adaptive ones are called to keep their counts.
+
+        :return: The entry target and the list of instructions.
+        """
+        program = []
+        # Conditions are emitted from the last one, so each knows the target following it.
+        # Frame: [remaining conditions, is or, target if true, target if false, target to start with]
+        is_or = self._operator == "or"
+        stack = [[reversed(self._conditions), is_or, self._TRUE, self._FALSE,
+                  self._FALSE if is_or else self._TRUE]]
+        while True:
+            frame = stack[-1]
+            children, is_or, if_true, if_false, target = frame
+            condition = next(children, None)
+
+            if condition is None:
+                stack.pop()
+                if not stack:
+                    entry = target
+                    break
+                stack[-1][4] = target
+            elif isinstance(condition, ConditionList) and not condition._adaptive:
+                child_true, child_false = (if_true, target) if is_or else (target, if_false)
+                child_or = condition._operator == "or"
+                # An empty list continues with its own result
+                stack.append([reversed(condition._conditions), child_or, child_true, child_false,
+                              child_false if child_or else child_true])
+            else:
+                # Conditions are immutable, their predicate is called without the is_true method
+                evaluate = condition._predicate if isinstance(condition, ObjectCondition) else condition.is_true
+                program.append((evaluate, if_true, target) if is_or else (evaluate, target, if_false))
+                frame[4] = len(program) - 1
+
+        # Reverse the instructions into evaluation order
+        last = len(program) - 1
+        program = [(evaluate, last - if_true if if_true >= 0 else if_true,
+                    last - if_false if if_false >= 0 else if_false)
+                   for evaluate, if_true, if_false in reversed(program)]
+        return last - entry if entry >= 0 else entry, program
+
+    def _build_predicate(self) -> Callable[[object], bool]:
+        """
+        Builds the evaluation function of the whole tree from the flattened program.
+
+        :return: Function taking the object and returning the result of all combined conditions.
+        """
+        entry, program = self._flatten()
+        result_true = self._TRUE
+
+        # The operators are resolved into the jump targets, so there is no branch on them per call.
+        # all()/any() over a generator of the children measured slower than following the
+        # targets and would recurse for nested lists again.
+        def predicate(obj: object) -> bool:
+            target = entry
+            while target >= 0:
+                evaluate, if_true, if_false = program[target]
+                target = if_true if evaluate(obj) else if_false
+            return target == result_true
+
+        return predicate
+
+    def _evaluate_first(self, obj: object) -> bool:
         """
-        Evaluates all conditions in the list using the specified logical operator.
+        Builds the predicate on first use after a change of the tree and binds it as is_true.
 
         :param obj: Object to check conditions against.
         :return: Boolean indicating the result of all combined conditions.
         """
-        result_list = []
-        for condition in self.conditions:
-            result = condition.is_true(obj)
-            result_list.append(result)
+        generation = self._generation
+        predicate = self._build_predicate()
+        with self.lock:
+            # A change during the build already reset is_true, the next call builds again
+            if generation == self._generation and not self._compiled:
+                self.is_true = predicate
+        return predicate(obj)
 
+    def _is_true_and_adaptive(self, obj: object) -> bool:
+        """
+        Evaluates the conditions combined with 'and' in ranked order and counts their results.
 
-        final_result = result_list[0]
-        for result in result_list[1:]:
-            if self.operator == "and":
-                final_result = final_result and result
-            elif self.operator == "or":
-                final_result = final_result or result
-            else:
-                raise ValueError(f"Unknown operator: {self.operator}")
+        :param obj: Object to check conditions against.
+        :return: Boolean indicating if all conditions hold true.
+        """
+        self._calls += 1
+        if self._calls >= self._reorder_interval:
+            self._reorder()
+        for stats in self._ranked:
+            stats[2] += 1
+            if not stats[0].is_true(obj):
+                return False
+            stats[1] += 1
+        return True
+
+    def _is_true_or_adaptive(self, obj: object) -> bool:
+        """
+        Evaluates the conditions combined with 'or' in ranked order and counts their results.
+
+        :param obj: Object to check conditions against.
+        :return: Boolean indicating if any condition holds true.
+        """
+        self._calls += 1
+        if self._calls >= self._reorder_interval:
+            self._reorder()
+        for stats in self._ranked:
+            stats[2] += 1
+            if stats[0].is_true(obj):
+                stats[1] += 1
+                return True
+        return False
+
+    def _reorder(self):
+        """
+        Sorts the ranked conditions by their true rate, the most deciding one first.
+        The counts are halved afterward, so older results fade out over time.
+        """
+        with self.lock:
+            self._calls = 0
+            ranked = sorted(self._ranked, key=self._true_rate, reverse=self._operator == "or")
+            for stats in ranked:
+                stats[1] //= 2
+                stats[2] //= 2
+            self._ranked = ranked
+
+    @staticmethod
+    def _true_rate(stats: list) -> float:
+        # Not yet evaluated conditions are ranked in the middle
+        return stats[1] / stats[2] if stats[2] else 0.5
+
+    def is_true_batch(self, objs) -> list[bool]:
+        """
+        Evaluates the conditions against many objects at once, one condition at a time.
+        Each condition is only evaluated for the objects not yet decided by the ones before.
+
+        :param objs: Iterable of objects to check conditions against.
+        :return: List of booleans in the order of the given objects.
+        """
+        objs = list(objs)
+        is_or = self._operator == "or"
+        pending = list(range(len(objs)))
+        conditions = [stats[0] for stats in self._ranked] if self._adaptive else self._conditions
+
+        # Selecting and filtering runs in map/compress, there is no Python loop per object
+        for condition in conditions:
+            if not pending:
+                break
+            results = condition.is_true_batch(list(map(objs.__getitem__, pending)))
+            # Objects decided by this condition drop out, true ones for 'or' and false ones for 'and'
+            pending = list(compress(pending, map(operator.not_, results) if is_or else results))
 
-        return final_result
+        results = [is_or] * len(objs)
+        for index in pending:
+            results[index] = not is_or
+        return results
 
     def to_dict(self) -> dict:
         """
@@ -381,8 +1031,8 @@ class ConditionList:
         :return: A dictionary with 'operator' and 'conditions' keys.
         """
         return {
-            "operator": self.operator,
-            "conditions": [condition.to_dict() for condition in self.conditions]
+            "operator": self._operator,
+            "conditions": [condition.to_dict() for condition in self._conditions]
         }
 
     def json(self) -> str:
@@ -394,11 +1044,12 @@ class ConditionList:
         return json.dumps(self.to_dict())
 
     @classmethod
-    def from_json(cls, data: str | dict) -> 'ConditionList':
+    def from_json(cls, data: str | dict, trusted: bool = False) -> 'ConditionList':
         """
         Creates a ConditionList instance from a JSON string or dictionary.
 
         :param data: A JSON string or dictionary with 'operator' and 'conditions'.
+        :param trusted: Skips the validation of the conditions for data written by to_dict or json.
         :return: ConditionList instance populated with the specified conditions and operator.
         """
         if isinstance(data, str):
@@ -408,15 +1059,15 @@ class ConditionList:
 
         operator = data.get("operator", "and")
         conditions = [
-            ObjectCondition.from_json(cond) if isinstance(cond, dict) and "attribute_name" in cond else cls.from_json(
-                cond)
+            ObjectCondition.from_json(cond, trusted) if isinstance(cond, dict) and "attribute_name" in cond
+            else cls.from_json(cond, trusted)
             for cond in data.get("conditions", [])
         ]
 
         return cls(*conditions, operator=operator)
 
     def __str__(self) -> str:
-        conditions_str = f" {self.operator.upper()} ".join(str(cond) for cond in self.conditions)
+        conditions_str = f" {self._operator.upper()} ".join(str(cond) for cond in self._conditions)
         return f"ConditionList({conditions_str})"
 
 